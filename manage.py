@@ -21,7 +21,7 @@ def main() -> None:
 
     # This allows easy placement of apps within the interior
     # wfcast directory.
-    current_path = Path(__file__).parent.resolve()
+    current_path = Path(__file__).parent
     sys.path.append(str(current_path / "wfcast"))
 
     execute_from_command_line(sys.argv)